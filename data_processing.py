@@ -0,0 +1,486 @@
+"""Laptop kataloğu yükleme, temizleme ve normalizasyon"""
+import os
+import re
+import json
+import hashlib
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+def env_int(name, default):
+    """Tam sayı ortam değişkeni; tanımsız veya geçersizse varsayılan değer"""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+class Config:
+    """Uygulama konfigürasyonu"""
+    # GitHub'daki veri dosyaları
+    DATASET_PATHS = [
+        'data/vatan_laptop_data_cleaned.csv',
+        'data/amazon_final.csv', 
+        'data/cleaned_incehesap_data.csv'
+    ]
+    
+    # Paralel veri yükleme (0 = otomatik)
+    INGEST_WORKERS = env_int('LAPTOP_INGEST_WORKERS', 0)
+    INGEST_CHUNK_BYTES = 50 * 1024 * 1024  # Bu boyutu aşan dosyalar parçalanır
+    INGEST_CHUNK_ROWS = 200_000
+    INGEST_PARALLEL_MIN_BYTES = 5 * 1024 * 1024  # Altında tek süreçte işlenir
+    
+    # Puan tabloları (GPU/CPU/marka skorları ve ağırlıklar) harici, sürümlü dosyadan yüklenir
+    SCORING_TABLES_PATH = os.environ.get('LAPTOP_SCORING_TABLES', 'data/scoring_tables.json')
+    GPU_SCORES = {}
+    CPU_SCORES = {}
+    BRAND_SCORES = {}
+    WEIGHTS = {}
+    
+    # Kullanım amaçları (her biri puan ağırlıklarında tanımlı olmalı)
+    PURPOSES = ['oyun', 'taşınabilirlik', 'üretkenlik', 'tasarım']
+    
+    # Harici GPU sayılmayan normalize GPU değerleri
+    INTEGRATED_GPUS = ['integrated', 'apple integrated', 'iris xe', 'intel uhd', 'unknown']
+    
+    # Sonuç önbelleği anahtarına giren filtre alanları
+    FILTER_KEYS = [
+        'search_query', 'min_budget', 'max_budget', 'screen_preference',
+        'os_preference', 'brand_preference', 'min_ram', 'min_ssd'
+    ]
+    
+    # Serbest metin aramasında indekslenen sütunlar
+    SEARCH_COLUMNS = ['name', 'gpu', 'cpu', 'os']
+    
+    # Pareto cephesi kriterleri (sütun -> daha iyi yön)
+    PARETO_CRITERIA = {
+        'price': 'min',
+        'performance_score': 'max',
+        'ram_gb': 'max',
+        'ssd_gb': 'max',
+        'portability': 'max',
+    }
+
+
+SCORING_TABLE_KEYS = {
+    'gpu_scores': 'GPU_SCORES',
+    'cpu_scores': 'CPU_SCORES',
+    'brand_scores': 'BRAND_SCORES',
+    'weights': 'WEIGHTS',
+}
+# Puanlamada kullanılan ağırlık yapısı (None = sayısal değer beklenir)
+WEIGHTS_SCHEMA = {
+    'price_fit': None,
+    'price_performance': None,
+    'purpose': dict(
+        {'base': None},
+        **{purpose: {'dedicated': None, 'integrated': None, 'apple': None} for purpose in Config.PURPOSES}
+    ),
+    'user_preferences': {'performance': None, 'battery': None, 'portability': None},
+    'specs': {'ram': None, 'ssd': None},
+    'brand_reliability': None,
+}
+_scoring_lock = threading.Lock()
+_scoring_file_stamp = None
+_active_tables = None
+
+def find_schema_errors(value, schema, path='weights'):
+    """Ağırlıkları şemaya göre kontrol et, eksik veya sayısal olmayan alanları döndür"""
+    if schema is None:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return [path]
+        return []
+    if not isinstance(value, dict):
+        return [path]
+    errors = []
+    for key, sub_schema in schema.items():
+        if key not in value:
+            errors.append(f"{path}.{key}")
+        else:
+            errors.extend(find_schema_errors(value[key], sub_schema, f"{path}.{key}"))
+    return errors
+
+def load_scoring_tables(path=None):
+    """Puan tablolarını dosyadan oku, doğrula ve sürüm anahtarıyla döndür"""
+    path = path or Config.SCORING_TABLES_PATH
+    with open(path, 'rb') as f:
+        raw = f.read()
+    tables = json.loads(raw.decode('utf-8'))
+    
+    missing = [key for key in SCORING_TABLE_KEYS if not isinstance(tables.get(key), dict)]
+    if missing:
+        raise ValueError(f"Puan tablosu eksik: {', '.join(missing)}")
+    for key in ('gpu_scores', 'cpu_scores', 'brand_scores'):
+        invalid = [name for name, score in tables[key].items()
+                   if isinstance(score, bool) or not isinstance(score, (int, float))]
+        if invalid:
+            raise ValueError(f"{key} içinde sayısal olmayan skor: {', '.join(invalid)}")
+    
+    invalid_weights = find_schema_errors(tables['weights'], WEIGHTS_SCHEMA)
+    if invalid_weights:
+        raise ValueError(f"Eksik veya sayısal olmayan ağırlık: {', '.join(invalid_weights)}")
+    
+    tables['version'] = f"{tables.get('version', 0)}-{hashlib.sha1(raw).hexdigest()[:8]}"
+    return tables
+
+def apply_scoring_tables(tables):
+    """Doğrulanmış puan tablolarını tek adımda etkinleştir"""
+    global _active_tables
+    with _scoring_lock:
+        _active_tables = tables
+        for key, attribute in SCORING_TABLE_KEYS.items():
+            setattr(Config, attribute, tables[key])
+
+def refresh_scoring_tables(path=None):
+    """Dosya değiştiyse puan tablolarını yeniden yükle
+    
+    (etkin tablolar, değişti_mi) döndürür. Tablolar sözlüğü tek bir tutarlı
+    anlık görüntüdür ('version' dahil). Dosya okunamaz veya geçersizse hata
+    fırlatır; bu durumda etkin tablolar değişmez.
+    """
+    global _scoring_file_stamp
+    path = path or Config.SCORING_TABLES_PATH
+    with _scoring_lock:
+        stat = os.stat(path)
+        stamp = (path, stat.st_mtime_ns, stat.st_size)
+        if stamp == _scoring_file_stamp and _active_tables is not None:
+            return _active_tables, False
+        tables = load_scoring_tables(path)
+        _scoring_file_stamp = stamp
+    
+    if _active_tables is not None and tables['version'] == _active_tables['version']:
+        return _active_tables, False
+    apply_scoring_tables(tables)
+    return tables, True
+
+def active_scoring_tables():
+    """Etkin puan tablolarının anlık görüntüsü (hiç yüklenmediyse None)"""
+    return _active_tables
+
+def current_scoring_tables():
+    """Etkin puan tablolarının anlık görüntüsü (henüz yüklenmediyse dosyadan yükle)"""
+    tables = _active_tables
+    if tables is None:
+        tables, _ = refresh_scoring_tables()
+    return tables
+
+def rescore_catalog(df, tables=None):
+    """Puan tablolarına bağlı türetilmiş sütunları yeniden hesapla
+    
+    Ham verinin yeniden temizlenmesi gerekmez; normalizasyon ve skorlar satır
+    başına değil, farklı ham değerler üzerinden bir eşleme olarak hesaplanır.
+    Tüm sütunlar aynı tablo anlık görüntüsüyle hesaplanır ve o sürümle etiketlenir.
+    """
+    tables = tables or current_scoring_tables()
+    gpu_scores, cpu_scores, brand_scores = tables['gpu_scores'], tables['cpu_scores'], tables['brand_scores']
+    df = df.copy()
+    
+    def map_distinct(column, func, missing):
+        mapping = {value: func(value) for value in df[column].dropna().unique()}
+        return df[column].map(mapping).fillna(missing)
+    
+    # GPU, CPU ve marka normalizasyonu (tablo anahtarlarına bağlı)
+    df['gpu_clean'] = map_distinct('gpu', lambda x: normalize_gpu(x, gpu_scores), 'unknown')
+    df['cpu_clean'] = map_distinct('cpu', lambda x: normalize_cpu(x, cpu_scores), 'unknown')
+    df['brand'] = map_distinct('name', lambda x: extract_brand(x, brand_scores), 'other')
+    
+    # Puanlama için sütunlar
+    df['gpu_score'] = map_distinct('gpu_clean', lambda x: gpu_scores.get(x, 30), 30)
+    df['cpu_score'] = map_distinct('cpu_clean', lambda x: cpu_scores.get(x, 50), 50)
+    df['brand_score'] = map_distinct('brand', lambda x: brand_scores.get(x, 0.70), 0.70)
+    
+    df['is_apple'] = df['brand'] == 'apple'
+    df['has_dedicated_gpu'] = ~df['gpu_clean'].isin(Config.INTEGRATED_GPUS)
+    
+    # 🚨 RTX5060 şüphelilerini yeni GPU eşlemesine göre tekrar çıkar
+    df['is_suspicious_rtx5060'] = (df['gpu_clean'] == 'rtx5060') & (df['price'] < 50000)
+    df = df[~df['is_suspicious_rtx5060']]
+    
+    df.attrs['scoring_version'] = tables['version']
+    df.attrs['catalog_version'] = compute_catalog_version(df)
+    return df
+
+def compute_catalog_version(df):
+    """İşlenmiş katalog içeriğinden kısa bir sürüm özeti üret"""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    return hashlib.sha1(row_hashes.tobytes()).hexdigest()[:12]
+
+def get_catalog_version(df):
+    """Katalog sürümünü döndür (yoksa hesapla)"""
+    version = df.attrs.get('catalog_version')
+    if version is None:
+        version = compute_catalog_version(df)
+        df.attrs['catalog_version'] = version
+    return version
+
+def clean_partition(df, tables=None):
+    """Bir veri parçasını satır bazında temizle ve normalize et"""
+    tables = tables or current_scoring_tables()
+    gpu_scores, cpu_scores, brand_scores = tables['gpu_scores'], tables['cpu_scores'], tables['brand_scores']
+    
+    # Sütun isimlerini temizle
+    df.columns = df.columns.str.strip().str.lower().str.replace(r'[\s\-]+', '_', regex=True)
+    
+    # Fiyatları temizle
+    df['price'] = df['price'].apply(clean_price)
+    
+    # Ekran boyutunu temizle
+    df['screen_size'] = df['screen_size'].apply(clean_screen_size)
+    
+    # Depolama ve RAM'i temizle
+    df['ssd_gb'] = df['ssd'].apply(lambda x: normalize_storage_ram(x, is_ssd=True))
+    df['ram_gb'] = df['ram'].apply(lambda x: normalize_storage_ram(x, is_ssd=False))
+    
+    # GPU ve CPU temizleme
+    df['gpu_clean'] = df['gpu'].apply(lambda x: normalize_gpu(x, gpu_scores))
+    df['cpu_clean'] = df['cpu'].apply(lambda x: normalize_cpu(x, cpu_scores))
+    
+    # Marka çıkarma
+    df['brand'] = df['name'].apply(lambda x: extract_brand(x, brand_scores))
+    
+    # Puanlama için sütunlar
+    df['gpu_score'] = df['gpu_clean'].apply(lambda x: gpu_scores.get(x, 30))
+    df['cpu_score'] = df['cpu_clean'].apply(lambda x: cpu_scores.get(x, 50))
+    df['brand_score'] = df['brand'].apply(lambda x: brand_scores.get(x, 0.70))
+    
+    df['is_apple'] = df['brand'] == 'apple'
+    df['has_dedicated_gpu'] = ~df['gpu_clean'].isin(Config.INTEGRATED_GPUS)
+    
+    # ⚡ RTX5060 FİLTRELEME - 50.000 TL altındaki RTX5060'ları şüpheli say
+    suspicious_rtx5060 = (df['gpu_clean'] == 'rtx5060') & (df['price'] < 50000)
+    df['is_suspicious_rtx5060'] = suspicious_rtx5060
+    
+    # Eksik verileri temizle
+    df = df.dropna(subset=['price', 'ram_gb', 'ssd_gb'])
+    df = df[df['price'] > 1000]  # Minimum fiyat filtresi
+    
+    # 🚨 RTX5060 şüphelilerini çıkar
+    df = df[~df['is_suspicious_rtx5060']]
+    
+    return df
+
+def merge_partitions(partitions):
+    """Temizlenmiş parçaları birleştir ve kaynaklar arası duplikatları kaldır"""
+    merged = pd.concat(partitions, ignore_index=True)
+    
+    # Kompakt kategorik sütunları tekrar metin tipine çevir
+    for column in merged.columns:
+        if isinstance(merged[column].dtype, pd.CategoricalDtype):
+            merged[column] = merged[column].astype(merged[column].cat.categories.dtype)
+    
+    # Duplikatları kaldır
+    return merged.drop_duplicates(subset=['name', 'price'], keep='first')
+
+def compact_partition(df):
+    """Süreçler arası aktarım için tekrarlı metin sütunlarını kategorik yap"""
+    for column in df.select_dtypes(include=['object', 'string']).columns:
+        if df[column].nunique(dropna=False) <= len(df) // 2:
+            df[column] = df[column].astype('category')
+    return df
+
+def plan_source_tasks(paths, chunk_bytes=None, chunk_rows=None):
+    """Her kaynak (veya büyük kaynağın her parçası) için bir iş üret
+    
+    (kaynak sırası, yol, iş, hata) döndürür. Küçük dosyalar işçide okunur;
+    büyük dosyalar burada parça parça okunup temizleme için işçilere dağıtılır.
+    Okuma hatası o kaynak için son öğe olarak (iş yerine hata ile) bildirilir.
+    """
+    chunk_bytes = chunk_bytes or Config.INGEST_CHUNK_BYTES
+    chunk_rows = chunk_rows or Config.INGEST_CHUNK_ROWS
+    
+    for i, path in enumerate(paths, 1):
+        source_id = f'dataset_{i}'
+        try:
+            if os.path.getsize(path) > chunk_bytes:
+                for chunk in pd.read_csv(path, encoding='utf-8', chunksize=chunk_rows):
+                    yield i, path, (path, source_id, chunk), None
+            else:
+                yield i, path, (path, source_id, None), None
+        except Exception as e:
+            yield i, path, None, e
+
+def process_source(task, tables=None):
+    """İşçi: kaynağı (veya parçayı) oku, temizle ve kompakt parça döndür"""
+    path, source_id, df = task
+    if df is None:
+        df = pd.read_csv(path, encoding='utf-8')
+    df['data_source'] = source_id
+    
+    # RTX5060 filtreleme sayacı
+    rtx5060_count = int(((df['gpu'].str.contains('rtx5060', case=False, na=False)) &
+                         (df['price'] < 50000)).sum())
+    
+    return compact_partition(clean_partition(df, tables)), rtx5060_count
+
+def resolve_worker_count(workers, paths, chunk_bytes=None):
+    """İşçi sayısını belirle (0 = otomatik, küçük kataloglar tek süreçte)"""
+    if workers:
+        return max(1, workers)
+    
+    chunk_bytes = chunk_bytes or Config.INGEST_CHUNK_BYTES
+    sizes = [os.path.getsize(path) if os.path.exists(path) else 0 for path in paths]
+    has_chunks = any(size > chunk_bytes for size in sizes)
+    if not has_chunks and sum(sizes) < Config.INGEST_PARALLEL_MIN_BYTES:
+        return 1
+    cpu_count = os.cpu_count() or 1
+    return cpu_count if has_chunks else max(1, min(len(paths), cpu_count))
+
+def ingest_sources(paths, workers=None, tables=None):
+    """Kaynakları süreç havuzunda oku ve temizle
+    
+    Sıralı parçaları, toplam şüpheli RTX5060 sayısını ve kaynak bazında
+    (yol, hata) listesini döndürür. Bir kaynağın herhangi bir parçası
+    okunamaz veya temizlenemezse o kaynağın tüm parçaları atılır; diğer
+    kaynaklar etkilenmez. Parçalar okundukça gönderilir ve bellekte en fazla
+    işçi sayısının iki katı kadar parça bekler.
+    Tüm parçalar aynı puan tablosu anlık görüntüsüyle (`tables`) temizlenir.
+    """
+    workers = resolve_worker_count(Config.INGEST_WORKERS if workers is None else workers, paths)
+    tables = tables or current_scoring_tables()
+    results = {}  # kaynak sırası -> [(parça, rtx5060 sayısı), ...]
+    errors = {}   # kaynak sırası -> (yol, hata)
+    
+    def fail(source, path, error):
+        errors.setdefault(source, (path, error))
+    
+    if workers <= 1:
+        for source, path, task, error in plan_source_tasks(paths):
+            if error is not None:
+                fail(source, path, error)
+                continue
+            if source in errors:
+                continue
+            try:
+                results.setdefault(source, []).append(process_source(task, tables))
+            except Exception as e:
+                fail(source, path, e)
+    else:
+        max_in_flight = workers * 2
+        in_flight = deque()
+        
+        def collect_oldest():
+            source, path, future = in_flight.popleft()
+            try:
+                results.setdefault(source, []).append(future.result())
+            except Exception as e:
+                fail(source, path, e)
+        
+        # Çok thread'li Streamlit sunucusunda fork, başka thread'lerin tuttuğu
+        # kilitlerle (logging, _scoring_lock) çocuk süreçleri kilitleyebilir
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            for source, path, task, error in plan_source_tasks(paths):
+                if error is not None:
+                    fail(source, path, error)
+                    continue
+                if source in errors:
+                    continue
+                while len(in_flight) >= max_in_flight:
+                    collect_oldest()
+                try:
+                    in_flight.append((source, path, pool.submit(process_source, task, tables)))
+                except Exception as e:
+                    # Havuz bozulduysa (ör. işçi süreci başlatılamadı) kaynak hatalı sayılır
+                    fail(source, path, e)
+            while in_flight:
+                collect_oldest()
+    
+    kept = [chunk for source in sorted(results) if source not in errors for chunk in results[source]]
+    partitions = [partition for partition, _ in kept]
+    rtx5060_count = sum(count for _, count in kept)
+    return partitions, rtx5060_count, [errors[source] for source in sorted(errors)]
+
+def clean_price(val):
+    """Fiyat temizleme"""
+    if pd.isna(val):
+        return None
+    
+    price_str = str(val).strip()
+    price_str = re.sub(r'[^\d,.]', '', price_str)
+    
+    try:
+        if ',' in price_str:
+            price_str = price_str.replace(',', '')
+        return float(price_str)
+    except:
+        return None
+
+def clean_screen_size(val):
+    """Ekran boyutu temizleme"""
+    if pd.isna(val):
+        return None
+    
+    screen_str = str(val).replace('"', '').replace("'", '')
+    match = re.search(r'(\d+(?:\.\d+)?)', screen_str)
+    if match:
+        return float(match.group(1))
+    return None
+
+def normalize_storage_ram(val, is_ssd=True):
+    """SSD ve RAM normalizasyonu"""
+    if pd.isna(val):
+        return None
+    
+    val_str = str(val).upper().strip()
+    
+    # TB dönüşümü
+    tb_match = re.search(r'(\d+(?:\.\d+)?)\s*TB', val_str)
+    if tb_match:
+        return int(float(tb_match.group(1)) * 1024)
+    
+    # GB dönüşümü
+    gb_match = re.search(r'(\d+(?:\.\d+)?)\s*GB', val_str)
+    if gb_match:
+        return int(float(gb_match.group(1)))
+    
+    # Sadece sayı
+    number_match = re.search(r'(\d+)', val_str)
+    if number_match:
+        return int(number_match.group(1))
+    
+    return None
+
+def normalize_gpu(gpu_str, gpu_scores=None):
+    """GPU normalizasyonu"""
+    gpu_scores = Config.GPU_SCORES if gpu_scores is None else gpu_scores
+    if pd.isna(gpu_str):
+        return 'unknown'
+    
+    g_low = str(gpu_str).lower()
+    
+    for key in sorted(gpu_scores.keys(), key=len, reverse=True):
+        if key in g_low:
+            return key
+    
+    return 'unknown'
+
+def normalize_cpu(cpu_str, cpu_scores=None):
+    """CPU normalizasyonu"""
+    cpu_scores = Config.CPU_SCORES if cpu_scores is None else cpu_scores
+    if pd.isna(cpu_str):
+        return 'unknown'
+    
+    c_low = str(cpu_str).lower()
+    
+    for key in sorted(cpu_scores.keys(), key=len, reverse=True):
+        if key in c_low:
+            return key
+    
+    return 'unknown'
+
+def extract_brand(name, brand_scores=None):
+    """İsimden marka çıkar"""
+    brand_scores = Config.BRAND_SCORES if brand_scores is None else brand_scores
+    name_lower = str(name).lower()
+    for brand in brand_scores.keys():
+        if brand in name_lower:
+            return brand
+    return 'other'
+
+# Puan tablolarını import sırasında yükle; dosya okunamazsa import bozulmaz,
+# hata ilk kullanımda (uygulamada st.error ile) yeniden raporlanır
+try:
+    refresh_scoring_tables()
+except Exception:
+    pass
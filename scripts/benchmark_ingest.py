@@ -0,0 +1,42 @@
+"""Çok kaynaklı veri yükleme benchmark'ı (tek süreç vs. süreç havuzu)
+
+Kullanım:
+    python scripts/benchmark_ingest.py --sources 12 --rows 20000 --workers 4
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from synthetic_catalog import write_synthetic_sources
+from data_processing import ingest_sources, merge_partitions
+
+
+def timed_ingest(paths, workers):
+    start = time.perf_counter()
+    partitions, _, errors = ingest_sources(paths, workers=workers)
+    merged = merge_partitions(partitions)
+    return time.perf_counter() - start, len(merged), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', type=int, default=12)
+    parser.add_argument('--rows', type=int, default=20_000, help='Kaynak başına satır')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_synthetic_sources(directory, args.sources, args.rows)
+        paths.append(os.path.join(directory, 'missing_retailer.csv'))  # Hata izolasyonu kontrolü
+        
+        serial_time, serial_rows, errors = timed_ingest(paths, workers=1)
+        print(f"Tek süreç: {serial_time:.2f} s, {serial_rows:,} satır, {len(errors)} hatalı kaynak")
+        
+        parallel_time, parallel_rows, errors = timed_ingest(paths, workers=args.workers)
+        print(f"{args.workers} işçi: {parallel_time:.2f} s, {parallel_rows:,} satır, {len(errors)} hatalı kaynak")
+        print(f"Hızlanma: {serial_time / parallel_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Pareto cephesi (skyline) benchmark'ı
+
+Üç senaryo ölçülür:
+  * yeniden örneklenmiş katalog (az sayıda ayrı donanım profili),
+  * sürekli performans puanlı katalog (her satır ayrı profil),
+  * doğrudan skyline_indices üzerinde bağımsız ve ters ilişkili rastgele noktalar.
+
+Kullanım:
+    python scripts/benchmark_pareto.py --rows 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from synthetic_catalog import build_synthetic_catalog
+import streamlit_app as app  # noqa: E402
+
+# Pareto kriterlerini (fiyat hariç) belirleyen ham sütunlar
+PROFILE_COLUMNS = ['gpu_score', 'cpu_score', 'ram_gb', 'ssd_gb', 'screen_size', 'is_apple', 'has_dedicated_gpu']
+
+
+def naive_skyline(values):
+    """Karşılaştırma için tüm çiftleri kontrol eden O(n^2) referans"""
+    return [
+        i for i, point in enumerate(values)
+        if not (np.all(values <= point, axis=1) & np.any(values < point, axis=1)).any()
+    ]
+
+
+def naive_pareto_count(df):
+    """find_pareto_laptops için naive referans satır sayısı"""
+    pareto_df = df.copy()
+    pareto_df['performance_score'] = pareto_df['gpu_score'] * 0.6 + pareto_df['cpu_score'] * 0.4
+    pareto_df['portability'] = app.compute_portability_factor(pareto_df)
+    values = np.column_stack([
+        pareto_df[col].to_numpy(dtype=float) * (1 if direction == 'min' else -1)
+        for col, direction in app.Config.PARETO_CRITERIA.items()
+    ])
+    return len(naive_skyline(values))
+
+
+def random_points(n_rows, dims, anti_correlated, seed=0):
+    """Bağımsız veya ters ilişkili (bir kriterde iyi olan diğerinde kötü) noktalar"""
+    rng = np.random.default_rng(seed)
+    points = rng.random((n_rows, dims))
+    if anti_correlated:
+        points[:, 0] = 1 - points[:, 1:].mean(axis=1) + rng.normal(0, 0.02, n_rows)
+    return points
+
+
+def best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def benchmark_catalog(label, df, check_rows, repeat):
+    """find_pareto_laptops'u ölç ve alt örnekte naive referansla doğrula"""
+    profiles = len(df.drop_duplicates(subset=PROFILE_COLUMNS))
+    frontier, elapsed = best_time(lambda: app.find_pareto_laptops(df), repeat)
+    print(f"{label}: {len(df):,} satır, ~{profiles:,} profil -> {len(frontier):,} laptop, en iyi {elapsed * 1000:.1f} ms")
+    
+    subset = df.head(check_rows)
+    expected = naive_pareto_count(subset)
+    actual = len(app.find_pareto_laptops(subset))
+    print(f"  doğrulama ({len(subset):,} satır): skyline={actual}, naive={expected}")
+    if actual != expected:
+        raise SystemExit("Skyline sonucu naive referansla uyuşmuyor!")
+
+
+def benchmark_points(label, points, check_rows, repeat):
+    """skyline_indices'i ham noktalarda ölç ve alt örnekte doğrula"""
+    keep, elapsed = best_time(lambda: app.skyline_indices(points), repeat)
+    print(f"{label}: {len(points):,} nokta -> cephe {len(keep):,}, en iyi {elapsed * 1000:.1f} ms")
+    
+    subset = points[:check_rows]
+    if sorted(app.skyline_indices(subset)) != naive_skyline(subset):
+        raise SystemExit("Skyline sonucu naive referansla uyuşmuyor!")
+    print(f"  doğrulama ({len(subset):,} nokta): tamam")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--check-rows', type=int, default=5_000,
+                        help='Naive referansla doğrulanacak alt örnek boyutu')
+    parser.add_argument('--anti-rows', type=int, default=20_000,
+                        help='Ters ilişkili senaryonun nokta sayısı (cephe ~ tüm noktalar, maliyet ~ n^2)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    benchmark_catalog("Yeniden örneklenmiş katalog", build_synthetic_catalog(args.rows), args.check_rows, args.repeat)
+    benchmark_catalog("Ayrı profilli katalog", build_synthetic_catalog(args.rows, distinct_profiles=True),
+                      args.check_rows, args.repeat)
+    
+    dims = len(app.Config.PARETO_CRITERIA)
+    benchmark_points("Bağımsız noktalar", random_points(args.rows, dims, False), args.check_rows, args.repeat)
+    benchmark_points("Ters ilişkili noktalar", random_points(args.anti_rows, dims, True), args.check_rows, 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Serbest arama doğruluk kontrolü
+
+Gönderilmiş sorgular (Enter ile, sonda boşluk olmadan) ve sonda boşluklu
+sorgular için her sonuç satırının istenen ekran boyutuna veya SSD
+kapasitesine sahip olduğunu doğrular. Örn. "16 inç" yalnızca 16" ekranlı,
+"rtx 4060 16 inç" yalnızca RTX 4060'lı 16" ekranlı listeleri döndürmeli.
+Sütun değeri listenin kendi metniyle çelişiyorsa (başlıkta 16,1 inç,
+screen_size 15.6) metindeki değer esas alınır.
+
+Kullanım:
+    python scripts/check_search.py   # uyuşmazlık varsa çıkış kodu 1
+"""
+import warnings
+
+warnings.filterwarnings('ignore')
+
+from synthetic_catalog import load_seed_catalog
+from data_processing import compute_catalog_version
+import streamlit_app as app  # noqa: E402
+
+
+def states_value(text, value, unit):
+    """Liste metni değeri birimiyle birlikte yazıyor mu ("16,1 inç", "512 GB")"""
+    pieces = [piece for piece, _ in app.split_pieces(text)]
+    return any(a == f"{value:g}" and b == unit for a, b in zip(pieces, pieces[1:]))
+
+
+def size_queries(df):
+    """Katalogdaki her ekran boyutu ve SSD kapasitesi için (sorgu, sütun, değer, birim) üret"""
+    for size in sorted(df['screen_size'].dropna().unique()):
+        yield f"{size:g} inç", 'screen_size', size, 'inc'
+        yield f"rtx 4060 {size:g} inç", 'screen_size', size, 'inc'
+    for capacity in [256, 512]:
+        yield f"{capacity} gb ssd", 'ssd_gb', capacity, 'gb'
+
+
+def main():
+    df = load_seed_catalog()
+    df.attrs['catalog_version'] = compute_catalog_version(df)
+    index = app.SearchIndex(df)
+
+    failures = 0
+    for query, column, expected, unit in size_queries(df):
+        for submitted in (query, query + ' '):
+            result = df.loc[index.search(submitted)]
+            stated = result['name'].map(lambda name: states_value(name, expected, unit))
+            wrong = result[(result[column] != expected) & ~stated]
+            status = 'tamam' if wrong.empty else f"HATA: {len(wrong)} satır {column} != {expected:g}"
+            print(f"{submitted!r:>24}: {len(result):>4} sonuç, {status}")
+            failures += not wrong.empty
+
+    if failures:
+        raise SystemExit(f"{failures} sorgu yanlış listeler döndürdü")
+
+
+if __name__ == '__main__':
+    main()
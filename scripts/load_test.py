@@ -0,0 +1,220 @@
+"""streamlit_app için eşzamanlı oturum yük testi
+
+Her sanal kullanıcı ayrı bir AppTest oturumudur; oturumlar aynı süreçte
+thread'lerle çalıştığından gerçek Streamlit sunucusu gibi st.cache_data /
+st.cache_resource önbelleklerini paylaşırlar. Her adımda kenar çubuğu
+değerleri rastgele seçilir ve "Önerileri Getir" veya "Fırsatları Bul"
+butonuna basılır; marka ve serbest arama sorgusu da rastgele seçilir.
+
+Kullanım:
+    python scripts/load_test.py --rows 20000 --concurrency 1 2 4 8 --iterations 5
+
+İlk yükleme (oturumun ilk çalıştırması) rerun metriklerine katılmaz, ayrı
+sütunda raporlanır. Varsayılan katalog boyutu (20.000 satır) Pareto, bütçe
+eğrisi ve arama dizini maliyetlerinin gecikmede görünür olması içindir;
+gerçek katalog boyutuna göre --rows ile ayarlayın. "Fırsatları Bul" satır
+başına piyasa fiyatı hesapladığından süresi satır sayısının karesiyle artar
+(50.000 satırda rerun başına birkaç dakika).
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import tempfile
+import threading
+import time
+
+from synthetic_catalog import ROOT, write_synthetic_sources
+from data_processing import Config
+
+APP_PATH = os.path.join(ROOT, 'streamlit_app.py')
+ACTIONS = ['✨ Önerileri Getir', '🔍 Fırsatları Bul']
+
+# Serbest arama sorguları; boş sorgular aramasız oturumları temsil eder
+SEARCH_QUERIES = [
+    '', '', '', 'rtx 4060', 'rtx4050', 'i7', 'ryzen 7', '16 inç', '15.6 inç',
+    '32gb', '16 gb ram', '1 tb ssd', 'oled', 'macbook air m2', 'rtx 4060 16 inç', 'gaming i5',
+]
+
+
+def current_rss_mb():
+    """Sürecin anlık RSS değeri (MB)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except OSError:
+        # /proc yoksa (macOS) tepe değerle yetin
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 ** 2
+
+
+class RssSampler(threading.Thread):
+    """Test süresince tepe RSS değerini örnekle"""
+    
+    def __init__(self, interval=0.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_mb = current_rss_mb()
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+    
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.peak_mb
+
+
+def find_widget(elements, label):
+    return next(element for element in elements if element.label == label)
+
+
+def randomize_sidebar(at, rng):
+    """Kenar çubuğu tercihlerini rastgele değerlerle doldur"""
+    # Maksimum bütçe widget'ının varsayılanı (50.000) min_value'nun altında kalmamalı
+    min_budget = rng.randrange(10000, 50001, 1000)
+    find_widget(at.number_input, 'Minimum Bütçe (TL)').set_value(min_budget)
+    find_widget(at.number_input, 'Maksimum Bütçe (TL)').set_value(min_budget + rng.randrange(5000, 100000, 1000))
+    
+    for label in ['Ne için kullanacaksınız?', 'Ekran Boyutu', 'İşletim Sistemi', 'Minimum RAM (GB)', 'Minimum SSD (GB)']:
+        selectbox = find_widget(at.selectbox, label)
+        selectbox.select_index(rng.randrange(len(selectbox.options)))
+    
+    # Marka çoğu oturumda serbest bırakılır; aksi halde rastgele bir marka
+    brand = find_widget(at.selectbox, 'Marka Tercihi')
+    brand.select_index(0 if rng.random() < 0.7 else rng.randrange(len(brand.options)))
+    
+    # Arama dizini ve arama anahtarlı önbellek yolunu da çalıştır
+    find_widget(at.text_input, 'Ne arıyorsunuz?').set_value(rng.choice(SEARCH_QUERIES))
+    
+    for label in ['Performans', 'Pil Ömrü', 'Taşınabilirlik']:
+        find_widget(at.slider, label).set_value(rng.randint(1, 5))
+
+
+def run_session(session_id, iterations, timeout, samples, errors, lock):
+    """Tek sanal kullanıcı: ilk yükleme + rastgele tercihlerle buton tıklamaları"""
+    from streamlit.testing.v1 import AppTest
+    
+    rng = random.Random(session_id)
+    try:
+        start = time.perf_counter()
+        at = AppTest.from_file(APP_PATH, default_timeout=timeout).run()
+        first_load = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+        
+        reruns, rerun_start = [], time.perf_counter()
+        for _ in range(iterations):
+            randomize_sidebar(at, rng)
+            action = rng.choice(ACTIONS)
+            find_widget(at.button, action).click()
+            start = time.perf_counter()
+            at.run()
+            reruns.append((action, time.perf_counter() - start))
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+        
+        with lock:
+            samples['first_loads'].append(first_load)
+            samples['reruns'].extend(reruns)
+            if reruns:
+                samples['windows'].append((rerun_start, time.perf_counter()))
+    except Exception as e:
+        with lock:
+            errors.append(f"oturum {session_id}: {e!r}")
+
+
+def percentile(values, q):
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_level(concurrency, iterations, timeout):
+    """Belirli eşzamanlılıkta testi çalıştır ve özet metrikleri döndür"""
+    samples = {'first_loads': [], 'reruns': [], 'windows': []}
+    errors, lock = [], threading.Lock()
+    sampler = RssSampler()
+    sampler.start()
+    
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=run_session, args=(i, iterations, timeout, samples, errors, lock))
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    peak_rss = sampler.stop()
+    
+    # Throughput yalnızca rerun penceresinden hesaplanır (ilk yüklemeler hariç)
+    values = [latency for _, latency in samples['reruns']]
+    windows = samples['windows']
+    rerun_wall = max(end for _, end in windows) - min(begin for begin, _ in windows) if windows else 0.0
+    by_action = {
+        action: statistics.median([latency for name, latency in samples['reruns'] if name == action])
+        for action in {name for name, _ in samples['reruns']}
+    }
+    first_loads = samples['first_loads']
+    return {
+        'concurrency': concurrency,
+        'first_load_p50_s': percentile(first_loads, 50),
+        'first_load_max_s': max(first_loads, default=float('nan')),
+        'reruns': len(values),
+        'p50_s': percentile(values, 50),
+        'p95_s': percentile(values, 95),
+        'p99_s': percentile(values, 99),
+        'throughput_rps': len(values) / rerun_wall if rerun_wall else 0.0,
+        'peak_rss_mb': peak_rss,
+        'median_by_action_s': by_action,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000, help='Sentetik katalog satır sayısı (kaynak başına bölünür)')
+    parser.add_argument('--sources', type=int, default=3)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--iterations', type=int, default=5, help='Oturum başına buton tıklaması')
+    parser.add_argument('--timeout', type=float, default=600, help='Tek rerun için zaman aşımı (s)')
+    parser.add_argument('--json', help='Sonuçları bu dosyaya JSON olarak yaz')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        Config.DATASET_PATHS = write_synthetic_sources(directory, args.sources, max(1, args.rows // args.sources))
+        print(f"Sentetik katalog: {args.sources} kaynak, ~{args.rows:,} satır, başlangıç RSS {current_rss_mb():.0f} MB")
+        
+        # Soğuk yükleme: veri önbelleğini tek oturumla ısıt
+        warmup = run_level(1, 0, args.timeout)
+        if warmup['errors']:
+            raise SystemExit("Isınma başarısız: " + "; ".join(warmup['errors']))
+        print(f"Soğuk ilk yükleme: {warmup['first_load_p50_s']:.2f} s, RSS {warmup['peak_rss_mb']:.0f} MB")
+        
+        results = []
+        print(f"{'Oturum':>7}{'İlk yük. (s)':>14}{'Rerun':>7}{'p50 (s)':>10}{'p95 (s)':>10}{'p99 (s)':>10}"
+              f"{'Rerun/s':>10}{'Tepe RSS (MB)':>15}")
+        for concurrency in args.concurrency:
+            result = run_level(concurrency, args.iterations, args.timeout)
+            results.append(result)
+            print(f"{concurrency:>7}{result['first_load_p50_s']:>14.2f}{result['reruns']:>7}{result['p50_s']:>10.2f}{result['p95_s']:>10.2f}"
+                  f"{result['p99_s']:>10.2f}{result['throughput_rps']:>10.2f}{result['peak_rss_mb']:>15.0f}")
+            for action, median in sorted(result['median_by_action_s'].items()):
+                print(f"{'':>7}  medyan {action}: {median:.2f} s")
+            for error in result['errors']:
+                print(f"{'':>7}  HATA {error}")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'rows': args.rows, 'sources': args.sources, 'warmup': warmup, 'levels': results},
+                      f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
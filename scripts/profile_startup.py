@@ -0,0 +1,110 @@
+"""Soğuk başlangıç profili ve import süresi bütçe kontrolü
+
+Her ölçüm yeni bir Python sürecinde yapılır:
+  * `python -X importtime` ile streamlit_app import süresi ve modül dökümü
+  * Ağır kütüphanelerin (sklearn, plotly.express) import sırasında yüklenmediği
+  * AppTest ile ilk sayfa çiziminin tamamlanma süresi
+
+Kullanım:
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --check --budget-ms 1500   # CI: bütçe aşılırsa çıkış kodu 1
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import sırasında yüklenmemesi gereken (ilk kullanımda yüklenen) modüller.
+# plotly.graph_objects streamlit tarafından tembel (lazy) olarak zaten yüklendiği için listede yok.
+DEFERRED_MODULES = ['sklearn', 'plotly.express']
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+FIRST_RENDER_SNIPPET = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file('streamlit_app.py', default_timeout=300).run()
+elapsed = time.perf_counter() - start
+if at.exception:
+    raise SystemExit(f'Uygulama hatası: {at.exception}')
+print(elapsed)
+"""
+
+
+def run_python(args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def profile_import():
+    """Yeni süreçte `import streamlit_app` süresini ve modül dökümünü ölç"""
+    result = run_python(['-X', 'importtime', '-c', 'import streamlit_app'])
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, len(indent) // 2, int(self_us), int(cumulative_us)))
+    
+    total_us = next(cumulative for module, depth, _, cumulative in entries if module == 'streamlit_app')
+    top_level = [(module, cumulative) for module, depth, _, cumulative in entries
+                 if depth == 0 and module != 'streamlit_app']
+    app_imports = [(module, cumulative) for module, depth, _, cumulative in entries if depth == 1]
+    return total_us / 1000, sorted(top_level + app_imports, key=lambda item: -item[1])
+
+
+def loaded_deferred_modules():
+    """streamlit_app import edildikten sonra yüklenmiş ertelenmiş modüller"""
+    snippet = ('import json, sys, streamlit_app; '
+               f'print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))')
+    return json.loads(run_python(['-c', snippet]).stdout.strip().splitlines()[-1])
+
+
+def profile_first_render():
+    """Yeni süreçte AppTest ile ilk sayfa çiziminin süresi (saniye)"""
+    return float(run_python(['-c', FIRST_RENDER_SNIPPET]).stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help='Import ölçümü tekrar sayısı (medyan alınır)')
+    parser.add_argument('--top', type=int, default=15, help='Gösterilecek modül sayısı')
+    parser.add_argument('--budget-ms', type=float, default=float(os.environ.get('STARTUP_IMPORT_BUDGET_MS', 1500)))
+    parser.add_argument('--check', action='store_true', help='Bütçe aşılırsa hata koduyla çık')
+    parser.add_argument('--skip-render', action='store_true', help='İlk çizim ölçümünü atla')
+    args = parser.parse_args()
+    
+    runs = [profile_import() for _ in range(args.runs)]
+    import_ms = statistics.median(total for total, _ in runs)
+    _, modules = min(runs, key=lambda run: run[0])
+    
+    print(f"streamlit_app import süresi (medyan {args.runs} çalıştırma): {import_ms:.0f} ms")
+    print(f"{'Modül':<45}{'Kümülatif (ms)':>15}")
+    for module, cumulative_us in modules[:args.top]:
+        print(f"{module:<45}{cumulative_us / 1000:>15.1f}")
+    
+    loaded = loaded_deferred_modules()
+    print(f"Import sırasında yüklenen ertelenmiş modüller: {', '.join(loaded) or 'yok'}")
+    
+    if not args.skip_render:
+        print(f"İlk sayfa çizimi (AppTest, soğuk süreç): {profile_first_render():.2f} s")
+    
+    if args.check:
+        failures = []
+        if import_ms > args.budget_ms:
+            failures.append(f"import süresi {import_ms:.0f} ms > bütçe {args.budget_ms:.0f} ms")
+        if loaded:
+            failures.append(f"ertelenmesi gereken modüller import sırasında yüklendi: {', '.join(loaded)}")
+        if failures:
+            print("BAŞARISIZ: " + "; ".join(failures))
+            sys.exit(1)
+        print(f"BAŞARILI: import süresi bütçe içinde ({args.budget_ms:.0f} ms)")
+
+
+if __name__ == '__main__':
+    main()
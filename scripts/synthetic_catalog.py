@@ -0,0 +1,57 @@
+"""Benchmark ve yük testleri için sentetik laptop kataloğu üretici"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from data_processing import Config, ingest_sources, merge_partitions, compute_catalog_version  # noqa: E402
+
+
+def load_seed_catalog():
+    """Gerçek veri dosyalarını uygulamanın temizleme adımından geçir"""
+    partitions, _, errors = ingest_sources(Config.DATASET_PATHS, workers=1)
+    if errors:
+        raise RuntimeError(f"Veri dosyası yüklenemedi: {errors}")
+    return merge_partitions(partitions)
+
+
+def build_synthetic_catalog(n_rows, seed=42, distinct_profiles=False):
+    """Gerçek kataloğu yeniden örnekleyip fiyatları oynatarak n_rows satır üret
+    
+    `distinct_profiles` ile GPU/CPU puanları sürekli değerlerle oynatılır;
+    böylece neredeyse her satır ayrı bir donanım profili olur.
+    """
+    rng = np.random.default_rng(seed)
+    seed_df = load_seed_catalog()
+    
+    sample = seed_df.sample(n=n_rows, replace=True, random_state=seed).reset_index(drop=True)
+    sample['price'] = (sample['price'] * rng.uniform(0.8, 1.25, n_rows)).round(-1)
+    sample['ram_gb'] = rng.choice([8, 16, 24, 32, 64], n_rows, p=[0.2, 0.4, 0.1, 0.25, 0.05])
+    sample['ssd_gb'] = rng.choice([256, 512, 1024, 2048], n_rows, p=[0.1, 0.45, 0.35, 0.1])
+    if distinct_profiles:
+        sample['gpu_score'] = sample['gpu_score'] * rng.uniform(0.9, 1.1, n_rows)
+        sample['cpu_score'] = sample['cpu_score'] * rng.uniform(0.9, 1.1, n_rows)
+    sample['name'] = sample['name'] + ' #' + sample.index.astype(str)
+    sample.attrs['catalog_version'] = compute_catalog_version(sample)
+    return sample
+
+
+def write_synthetic_sources(directory, sources, rows, seed=0):
+    """Gerçek ham dosyaları yeniden örnekleyerek sentetik perakendeci CSV'leri yaz"""
+    raw = pd.concat([pd.read_csv(path) for path in Config.DATASET_PATHS], ignore_index=True)
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(sources):
+        sample = raw.sample(n=rows, replace=True, random_state=seed + i).reset_index(drop=True)
+        sample['price'] = (sample['price'] * rng.uniform(0.8, 1.25, rows)).round(-1)
+        sample['name'] = sample['name'] + f' #{i}-' + sample.index.astype(str)
+        path = os.path.join(directory, f'retailer_{i}.csv')
+        sample.to_csv(path, index=False)
+        paths.append(path)
+    return paths
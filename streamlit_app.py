@@ -2,16 +2,12 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import re
-import pickle
-import time
-from datetime import datetime, timedelta
-from typing import Union, Optional, Dict, Any, List, Tuple
+import bisect
 import warnings
-from sklearn.preprocessing import StandardScaler
-from sklearn.neighbors import NearestNeighbors
-from sklearn.ensemble import IsolationForest
-import plotly.express as px
-import plotly.graph_objects as go
+from data_processing import (
+    Config, ingest_sources, merge_partitions, compute_catalog_version, get_catalog_version,
+    refresh_scoring_tables, active_scoring_tables, current_scoring_tables, rescore_catalog
+)
 warnings.filterwarnings('ignore')
 
 # Streamlit sayfa konfigürasyonu
@@ -61,94 +57,25 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-class Config:
-    """Uygulama konfigürasyonu"""
-    # GitHub'daki veri dosyaları
-    DATASET_PATHS = [
-        'data/vatan_laptop_data_cleaned.csv',
-        'data/amazon_final.csv', 
-        'data/cleaned_incehesap_data.csv'
-    ]
-    
-    # GPU skorları
-    GPU_SCORES = {
-        'rtx5090': 110, 'rtx5080': 105, 'rtx5070': 100, 'rtx5060': 85, 'rtx5050': 75,
-        'rtx5000': 96, 'rtx4090': 100, 'rtx4080': 95, 'rtx3080': 88, 'rtx4070': 85,
-        'rtx3070': 80, 'rtx4060': 75, 'rtx3060': 70, 'rtx4050': 60,
-        'rtx3050': 55, 'rtx2060': 50, 'rtx': 45, 'gtx': 40,
-        'mx550': 38, 'intel arc': 45, 'apple integrated': 35, 'intel uhd': 22,
-        'intel iris xe graphics': 25, 'iris xe': 25, 'integrated': 20,
-        'unknown': 30
-    }
-    
-    # CPU skorları
-    CPU_SCORES = {
-        'ultra 9 275hx': 98, 'ultra 9': 100, 'ultra 7 255h': 92, 'ultra 7': 90,
-        'ultra 5 155h': 83, 'ultra 5': 80, 'core ultra 9': 98, 'core ultra 7': 90,
-        'core ultra 5': 83, 'ryzen ai 9 hx370': 95, 'core 5 210h': 75,
-        'i9': 95, 'i7': 85, 'i5': 75, 'i3': 60,
-        'ryzen 9': 95, 'ryzen 7': 85, 'ryzen 5': 75, 'ryzen 3': 60,
-        'm4 pro': 94, 'm4': 88, 'm3': 85, 'm2': 80, 'm1': 75,
-        'snapdragon x': 78, 'unknown': 50
-    }
-    
-    # Marka skorları
-    BRAND_SCORES = {
-        'apple': 0.95, 'dell': 0.85, 'hp': 0.80, 'lenovo': 0.85,
-        'asus': 0.82, 'msi': 0.80, 'acer': 0.75, 'monster': 0.70,
-        'huawei': 0.78, 'samsung': 0.83, 'lg': 0.77, 'gigabyte': 0.76
-    }
-    
-    # Puanlama ağırlıkları
-    WEIGHTS = {
-        'price_fit': 15,
-        'price_performance': 10,
-        'purpose': {
-            'base': 30,
-            'oyun': {'dedicated': 1.0, 'integrated': 0.1, 'apple': 0.5},
-            'taşınabilirlik': {'dedicated': 0.2, 'integrated': 1.0, 'apple': 0.9},
-            'üretkenlik': {'dedicated': 0.6, 'integrated': 0.4, 'apple': 1.0},
-            'tasarım': {'dedicated': 0.8, 'integrated': 0.5, 'apple': 1.0},
-        },
-        'user_preferences': {
-            'performance': 12,
-            'battery': 12,
-            'portability': 8,
-        },
-        'specs': {
-            'ram': 5,
-            'ssd': 5,
-        },
-        'brand_reliability': 8,
-    }
-
 @st.cache_data(ttl=3600)
 def load_and_process_data():
     """Veriyi yükle ve işle"""
-    datasets = []
-    
-    for i, path in enumerate(Config.DATASET_PATHS, 1):
-        try:
-            df = pd.read_csv(path, encoding='utf-8')
-            df['data_source'] = f'dataset_{i}'
-            datasets.append(df)
-        except Exception as e:
-            st.error(f"Veri dosyası yüklenemedi: {path} - {e}")
-            continue
+    tables = current_scoring_tables()
+    partitions, rtx5060_count_before, errors = ingest_sources(Config.DATASET_PATHS, tables=tables)
+    
+    for path, e in errors:
+        st.error(f"Veri dosyası yüklenemedi: {path} - {e}")
     
-    if not datasets:
+    if not partitions:
         st.error("Hiçbir veri dosyası yüklenemedi!")
         return pd.DataFrame()
     
-    # Veriyi birleştir
-    combined_df = pd.concat(datasets, ignore_index=True)
+    # Parçaları birleştir
+    processed_df = merge_partitions(partitions)
     
-    # RTX5060 filtreleme sayacı
-    rtx5060_count_before = len(combined_df[(combined_df['gpu'].str.contains('rtx5060', case=False, na=False)) & 
-                                           (combined_df['price'] < 50000)])
-    
-    # Veri temizleme
-    processed_df = clean_and_process_data(combined_df)
+    # Önbellek anahtarları için katalog ve puan tablosu sürümü
+    processed_df.attrs['catalog_version'] = compute_catalog_version(processed_df)
+    processed_df.attrs['scoring_version'] = tables['version']
     
     # Session state'e filtrelenen sayıyı kaydet
     if 'rtx5060_filtered' not in st.session_state:
@@ -156,141 +83,163 @@ def load_and_process_data():
     
     return processed_df
 
-def clean_and_process_data(df):
-    """Veri temizleme ve işleme"""
-    # Sütun isimlerini temizle
-    df.columns = df.columns.str.strip().str.lower().str.replace(r'[\s\-]+', '_', regex=True)
-    
-    # Duplikatları kaldır
-    df = df.drop_duplicates(subset=['name', 'price'], keep='first')
-    
-    # Fiyatları temizle
-    df['price'] = df['price'].apply(clean_price)
-    
-    # Ekran boyutunu temizle
-    df['screen_size'] = df['screen_size'].apply(clean_screen_size)
-    
-    # Depolama ve RAM'i temizle
-    df['ssd_gb'] = df['ssd'].apply(lambda x: normalize_storage_ram(x, is_ssd=True))
-    df['ram_gb'] = df['ram'].apply(lambda x: normalize_storage_ram(x, is_ssd=False))
-    
-    # GPU ve CPU temizleme
-    df['gpu_clean'] = df['gpu'].apply(normalize_gpu)
-    df['cpu_clean'] = df['cpu'].apply(normalize_cpu)
-    
-    # Marka çıkarma
-    df['brand'] = df['name'].apply(extract_brand)
-    
-    # Puanlama için sütunlar
-    df['gpu_score'] = df['gpu_clean'].apply(lambda x: Config.GPU_SCORES.get(x, 30))
-    df['cpu_score'] = df['cpu_clean'].apply(lambda x: Config.CPU_SCORES.get(x, 50))
-    df['brand_score'] = df['brand'].apply(lambda x: Config.BRAND_SCORES.get(x, 0.70))
-    
-    df['is_apple'] = df['brand'] == 'apple'
-    df['has_dedicated_gpu'] = ~df['gpu_clean'].isin(['integrated', 'apple integrated', 'iris xe', 'intel uhd', 'unknown'])
-    
-    # ⚡ RTX5060 FİLTRELEME - 50.000 TL altındaki RTX5060'ları şüpheli say
-    suspicious_rtx5060 = (df['gpu_clean'] == 'rtx5060') & (df['price'] < 50000)
-    df['is_suspicious_rtx5060'] = suspicious_rtx5060
-    
-    # Eksik verileri temizle
-    df = df.dropna(subset=['price', 'ram_gb', 'ssd_gb'])
-    df = df[df['price'] > 1000]  # Minimum fiyat filtresi
-    
-    # 🚨 RTX5060 şüphelilerini çıkar
-    df = df[~df['is_suspicious_rtx5060']]
-    
-    return df
-
-def clean_price(val):
-    """Fiyat temizleme"""
-    if pd.isna(val):
-        return None
-    
-    price_str = str(val).strip()
-    price_str = re.sub(r'[^\d,.]', '', price_str)
-    
-    try:
-        if ',' in price_str:
-            price_str = price_str.replace(',', '')
-        return float(price_str)
-    except:
-        return None
+# Türkçe büyük/küçük harf ve aksan katlama (İ/I/ı -> i, ç -> c, ...), inç işaretleri -> "inc"
+TURKISH_FOLD = str.maketrans({
+    'İ': 'i', 'I': 'i', 'ı': 'i',
+    'Ç': 'c', 'ç': 'c', 'Ş': 's', 'ş': 's', 'Ğ': 'g', 'ğ': 'g',
+    'Ü': 'u', 'ü': 'u', 'Ö': 'o', 'ö': 'o',
+    '″': ' inc ', '"': ' inc ',
+})
+TOKEN_PATTERN = re.compile(r'[a-z]+|\d+(?:[.,]\d+)?')
 
-def clean_screen_size(val):
-    """Ekran boyutu temizleme"""
-    if pd.isna(val):
-        return None
-    
-    screen_str = str(val).replace('"', '').replace("'", '')
-    match = re.search(r'(\d+(?:\.\d+)?)', screen_str)
-    if match:
-        return float(match.group(1))
-    return None
+def split_pieces(text):
+    """Metni Türkçe katlayıp harf/sayı parçalarına böl; her parça önceki parçayla arasındaki ayraçla döner"""
+    if pd.isna(text):
+        return []
+    folded = str(text).translate(TURKISH_FOLD).lower()
+    pieces, end = [], 0
+    for match in TOKEN_PATTERN.finditer(folded):
+        pieces.append((match.group().replace(',', '.'), folded[end:match.start()]))
+        end = match.end()
+    return pieces
 
-def normalize_storage_ram(val, is_ssd=True):
-    """SSD ve RAM normalizasyonu"""
-    if pd.isna(val):
-        return None
-    
-    val_str = str(val).upper().strip()
-    
-    # TB dönüşümü
-    tb_match = re.search(r'(\d+(?:\.\d+)?)\s*TB', val_str)
-    if tb_match:
-        return int(float(tb_match.group(1)) * 1024)
-    
-    # GB dönüşümü
-    gb_match = re.search(r'(\d+(?:\.\d+)?)\s*GB', val_str)
-    if gb_match:
-        return int(float(gb_match.group(1)))
-    
-    # Sadece sayı
-    number_match = re.search(r'(\d+)', val_str)
-    if number_match:
-        return int(number_match.group(1))
-    
-    return None
+def is_letter_digit_pair(first, second):
+    """Harf->sayı veya sayı->harf geçişi mi (rtx+4060, 32+gb)"""
+    return first[0].isdigit() != second[0].isdigit()
 
-def normalize_gpu(gpu_str):
-    """GPU normalizasyonu"""
-    if pd.isna(gpu_str):
-        return 'unknown'
-    
-    g_low = str(gpu_str).lower()
+class SearchIndex:
+    """Laptop listeleri için ters indeks (terim -> sıralı satır pozisyonları)
     
-    for key in sorted(Config.GPU_SCORES.keys(), key=len, reverse=True):
-        if key in g_low:
-            return key
+    Terimler harf/sayı parçaları ile bitişik (veya yalnızca boşlukla ayrılmış)
+    harf-sayı çiftleridir: "Core i7 13620H-RTX4060" -> core, i, 7, i7, 13620, h,
+    13620h, rtx, 4060, rtx4060. Böylece "i7" sorgusu yalnızca i ile 7'nin yan
+    yana geçtiği listelerle eşleşir.
+    """
     
-    return 'unknown'
+    def __init__(self, df):
+        postings = {}
+        # Katalogda bir sayıdan hemen önce (rtx4060) / hemen sonra (32gb) bitişik yazılan harf parçaları
+        self.letters_before_digits = set()
+        self.letters_after_digits = set()
+        for column in Config.SEARCH_COLUMNS:
+            if column not in df.columns:
+                continue
+            for position, value in enumerate(df[column].tolist()):
+                for term in self._document_terms(split_pieces(value)):
+                    postings.setdefault(term, set()).add(position)
+        
+        self.labels = df.index.to_numpy()
+        self.terms = sorted(postings)
+        self.sorted_letters_before_digits = sorted(self.letters_before_digits)
+        self.sorted_letters_after_digits = sorted(self.letters_after_digits)
+        self.postings = [np.array(sorted(postings[term]), dtype=np.int64) for term in self.terms]
+    
+    def _document_terms(self, pieces):
+        terms = {piece for piece, _ in pieces}
+        for (first, _), (second, gap) in zip(pieces, pieces[1:]):
+            if not is_letter_digit_pair(first, second):
+                continue
+            if gap == '' and first[0].isdigit():
+                self.letters_after_digits.add(second)
+            elif gap == '':
+                self.letters_before_digits.add(first)
+            if gap == '' or gap.isspace():
+                terms.add(first + second)
+        return terms
+    
+    def query_terms(self, query):
+        """Sorgu terimleri ve önek eşleşmesi bayrağı: [(terim, önek_mi), ...]
+        
+        Bitişik harf-sayı çiftleri ("i7", "rtx4060", "32gb") her zaman çift olarak
+        aranır. Boşlukla ayrılmış çiftler ("rtx 4060", "16 inç") yalnızca harf
+        parçası katalogda aynı yönde sayıya bitişik yazılıyorsa birleştirilir; böylece
+        "oled 32gb" gibi bağımsız kelimeler birbirine bağlanmaz. Son parça yazım
+        sürerken (önek) birleştirilmiş çift de önek olarak aranır ("16 in" -> 16in*).
+        """
+        pieces = split_pieces(query)
+        is_typing = not str(query)[-1:].isspace()
+        terms = []
+        for i, (piece, gap) in enumerate(pieces):
+            is_prefix = is_typing and i == len(pieces) - 1
+            terms.append((piece, is_prefix))
+            if i == 0 or not is_letter_digit_pair(pieces[i - 1][0], piece):
+                continue
+            previous = pieces[i - 1][0]
+            if previous[0].isdigit():
+                attached = self._is_attached(self.sorted_letters_after_digits, piece, is_prefix)
+            else:
+                attached = self._is_attached(self.sorted_letters_before_digits, previous, False)
+            if gap == '' or (gap.isspace() and attached):
+                terms.append((previous + piece, is_prefix))
+        return terms
+    
+    @staticmethod
+    def _is_attached(letters, piece, is_prefix):
+        """Harf parçası (önekse onunla başlayan bir harf dizisi) katalogda sayıya bitişik mi"""
+        i = bisect.bisect_left(letters, piece)
+        if i == len(letters):
+            return False
+        return letters[i].startswith(piece) if is_prefix else letters[i] == piece
+    
+    def _exact(self, term):
+        """Tam eşleşen terimin posting listesi"""
+        i = bisect.bisect_left(self.terms, term)
+        if i < len(self.terms) and self.terms[i] == term:
+            return self.postings[i]
+        return np.empty(0, dtype=np.int64)
+    
+    def _prefix(self, prefix):
+        """Önekle başlayan tüm terimlerin birleşik posting listesi"""
+        start = bisect.bisect_left(self.terms, prefix)
+        end = bisect.bisect_left(self.terms, prefix + '\uffff')
+        if start == end:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(self.postings[start:end]))
+    
+    def suggest(self, prefix, limit=5):
+        """Typeahead için önekle başlayan en yaygın terimler"""
+        start = bisect.bisect_left(self.terms, prefix)
+        end = bisect.bisect_left(self.terms, prefix + '\uffff')
+        ranked = sorted(range(start, end), key=lambda i: len(self.postings[i]), reverse=True)
+        return [self.terms[i] for i in ranked[:limit]]
+    
+    def search(self, query):
+        """Tüm sorgu terimlerini içeren satırların index etiketlerini döndür
+        
+        Son terim, yazım devam ederken öneki olarak eşleşir.
+        """
+        terms = self.query_terms(query)
+        if not terms:
+            return self.labels
+        
+        lists = [self._prefix(term) if is_prefix else self._exact(term) for term, is_prefix in terms]
+        
+        # En kısa listeden başlayarak kesiştir
+        lists.sort(key=len)
+        result = lists[0]
+        for postings in lists[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, postings, assume_unique=True)
+        
+        return self.labels[result]
 
-def normalize_cpu(cpu_str):
-    """CPU normalizasyonu"""
-    if pd.isna(cpu_str):
-        return 'unknown'
-    
-    c_low = str(cpu_str).lower()
-    
-    for key in sorted(Config.CPU_SCORES.keys(), key=len, reverse=True):
-        if key in c_low:
-            return key
-    
-    return 'unknown'
+@st.cache_resource(max_entries=4)
+def get_search_index(_df, catalog_version):
+    """Ters indeksi katalog sürümü başına bir kez oluştur"""
+    return SearchIndex(_df)
 
-def extract_brand(name):
-    """İsimden marka çıkar"""
-    name_lower = str(name).lower()
-    for brand in Config.BRAND_SCORES.keys():
-        if brand in name_lower:
-            return brand
-    return 'other'
+def search_catalog(df, query):
+    """Serbest metin sorgusuna uyan satırları döndür"""
+    if not query or not query.strip():
+        return df
+    index = get_search_index(df, get_catalog_version(df))
+    return df[df.index.isin(index.search(query))]
 
-def calculate_laptop_score(row, preferences):
-    """Laptop puanını hesapla"""
+def calculate_laptop_score(row, preferences, weights):
+    """Laptop puanını hesapla (`weights`: puan tablosu anlık görüntüsünün ağırlıkları)"""
     try:
         score = 0
-        weights = Config.WEIGHTS
         
         # 1. Fiyat uygunluğu
         price_range = preferences['max_budget'] - preferences['min_budget']
@@ -355,6 +304,10 @@ def apply_filters(df, preferences):
     """Filtreleri uygula"""
     filtered_df = df.copy()
     
+    # Serbest metin araması
+    if preferences.get('search_query'):
+        filtered_df = search_catalog(filtered_df, preferences['search_query'])
+    
     # Fiyat filtresi
     filtered_df = filtered_df[
         (filtered_df['price'] >= preferences['min_budget']) &
@@ -389,7 +342,7 @@ def apply_filters(df, preferences):
     
     return filtered_df
 
-def get_recommendations(df, preferences):
+def get_recommendations(df, preferences, weights):
     """Önerileri getir"""
     # Filtreleri uygula
     filtered_df = apply_filters(df, preferences)
@@ -399,7 +352,7 @@ def get_recommendations(df, preferences):
     
     # Puanları hesapla
     filtered_df = filtered_df.copy()
-    filtered_df['score'] = filtered_df.apply(lambda row: calculate_laptop_score(row, preferences), axis=1)
+    filtered_df['score'] = filtered_df.apply(lambda row: calculate_laptop_score(row, preferences, weights), axis=1)
     
     # En iyileri seç
     top_laptops = filtered_df.nlargest(10, 'score')
@@ -467,11 +420,243 @@ def calculate_market_price(target_row, df):
     
     return target_row['price'] * 1.2  # Varsayılan %20 ekle
 
+def get_filter_key(preferences):
+    """Filtre tercihlerinden hashlenebilir önbellek anahtarı üret"""
+    return tuple((key, preferences.get(key)) for key in Config.FILTER_KEYS)
+
+def compute_portability_factor(df):
+    """Vektörel taşınabilirlik katsayısı (calculate_laptop_score ile aynı kurallar)"""
+    factor = np.where(
+        df['is_apple'], 0.9,
+        np.where(df['has_dedicated_gpu'], 0.4,
+                 np.where(df['screen_size'] <= 14, 1.2, 1.0))
+    )
+    return pd.Series(factor, index=df.index)
+
+def skyline_indices(values, block_size=512, max_pairs=1 << 20):
+    """Sort-filter-skyline: hiçbir satırın baskın olmadığı satır indekslerini döndür
+    
+    `values` (n, d) boyutlu bir dizidir; tüm kriterlerde küçük değer daha iyidir.
+    Satırlar monoton bir skora göre sıralandığı için bir satıra baskın olan her
+    satır ondan önce işlenir. Adaylar `block_size`'lık bloklar halinde önce
+    mevcut cepheyle, sonra blok içinde vektörel olarak karşılaştırılır; ara
+    diziler en fazla `max_pairs` satır çifti tutar.
+    
+    Maliyet O(n * h * d) karşılaştırmadır (h: cephe boyutu). Bağımsız veya
+    ilişkili kriterlerde h küçük kalır; kriterler ters ilişkiliyse (neredeyse
+    her satır cephede) maliyet O(n^2)'ye yaklaşır.
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return np.empty(0, dtype=int)
+    
+    # Normalize toplam skor, eşitlikler için sütunlar sırayla
+    low = values.min(axis=0)
+    span = values.max(axis=0) - low
+    span[span == 0] = 1
+    entropy = ((values - low) / span).sum(axis=1)
+    order = np.lexsort(tuple(values[:, i] for i in range(values.shape[1] - 1, -1, -1)) + (entropy,))
+    
+    def dominated_by(front, points):
+        """`points` içinde `front`'taki bir satırın baskın olduğu satırlar"""
+        dominated = np.zeros(len(points), dtype=bool)
+        # Cephenin başındaki (en güçlü) satırlar adayların çoğunu eler; dilimleri
+        # küçük başlatıp büyüt ve elenen adayları sonraki dilimlerde atla
+        start, step = 0, 64
+        while start < len(front):
+            alive = np.flatnonzero(~dominated)
+            if len(alive) == 0:
+                break
+            step = min(step * 2, max(1, max_pairs // len(alive)))
+            part = front[start:start + step]
+            start += len(part)
+            no_worse = np.ones((len(alive), len(part)), dtype=bool)
+            better = np.zeros_like(no_worse)
+            for column in range(values.shape[1]):
+                candidate = points[alive, column][:, None]
+                no_worse &= part[:, column] <= candidate
+                better |= part[:, column] < candidate
+            dominated[alive] = (no_worse & better).any(axis=1)
+        return dominated
+    
+    window = np.empty_like(values)
+    size = 0
+    keep = []
+    for start in range(0, len(order), block_size):
+        block = order[start:start + block_size]
+        if size:
+            block = block[~dominated_by(window[:size], values[block])]
+        if len(block) == 0:
+            continue
+        # Blok içinde sıra gözetmeden karşılaştır: elenmiş bir satırın baskın
+        # olduğu satıra, geçişlilik gereği onu eleyen satır da baskındır
+        block = block[~dominated_by(values[block], values[block])]
+        window[size:size + len(block)] = values[block]
+        size += len(block)
+        keep.extend(block.tolist())
+    
+    return np.array(keep, dtype=int)
+
+def find_pareto_laptops(df):
+    """Pareto cephesindeki ("daha ucuza daha iyisi yok") laptopları bul"""
+    if df.empty:
+        return df.iloc[0:0]
+    
+    pareto_df = df.copy()
+    pareto_df['performance_score'] = pareto_df['gpu_score'] * 0.6 + pareto_df['cpu_score'] * 0.4
+    pareto_df['portability'] = compute_portability_factor(pareto_df)
+    
+    # Aynı donanım profilinde yalnızca en ucuz fiyat cephede olabilir
+    criteria = list(Config.PARETO_CRITERIA.keys())
+    quality_cols = [col for col in criteria if col != 'price']
+    cheapest = pareto_df.groupby(quality_cols, sort=False)['price'].min().reset_index()
+    
+    # Tüm kriterleri "küçük daha iyi" yönüne çevir
+    values = np.column_stack([
+        cheapest[col].to_numpy(dtype=float) * (1 if direction == 'min' else -1)
+        for col, direction in Config.PARETO_CRITERIA.items()
+    ])
+    frontier = cheapest.iloc[skyline_indices(values)]
+    
+    # Cephedeki profilleri (eşit fiyatlı kopyalarla birlikte) satırlara geri aç
+    row_keys = pd.MultiIndex.from_frame(pareto_df[criteria])
+    frontier_keys = pd.MultiIndex.from_frame(frontier[criteria])
+    pareto_df = pareto_df[row_keys.isin(frontier_keys)]
+    
+    return pareto_df.sort_values('price')
+
+@st.cache_data(ttl=3600, max_entries=64)
+def get_pareto_frontier(_df, catalog_version, filter_key):
+    """Pareto cephesini katalog sürümü ve filtre kombinasyonu başına önbellekle"""
+    return find_pareto_laptops(apply_filters(_df, dict(filter_key)))
+
+def get_preference_key(preferences):
+    """Bütçeden bağımsız tercihlerden hashlenebilir önbellek anahtarı üret"""
+    budget_keys = {'min_budget', 'max_budget', 'ideal_price'}
+    return tuple(sorted((key, value) for key, value in preferences.items() if key not in budget_keys))
+
+def calculate_quality_scores(df, preferences, weights):
+    """Vektörel, bütçeden bağımsız puan (calculate_laptop_score 3-6. adımları)"""
+    # Kullanım amacı
+    purpose_weights = weights['purpose'][preferences['purpose']]
+    multiplier = np.where(
+        df['is_apple'], purpose_weights['apple'],
+        np.where(df['has_dedicated_gpu'], purpose_weights['dedicated'], purpose_weights['integrated'])
+    )
+    combined_performance = (df['gpu_score'] * 0.7 + df['cpu_score'] * 0.3) / 100
+    score = weights['purpose']['base'] * combined_performance * multiplier
+    
+    # Kullanıcı tercihleri
+    user_weights = weights['user_preferences']
+    perf_score = (df['gpu_score'] * 0.6 + df['cpu_score'] * 0.4) / 100
+    score += user_weights['performance'] * perf_score * (preferences['performance_importance'] / 5)
+    
+    portability_factor = compute_portability_factor(df)
+    score += user_weights['battery'] * portability_factor * (preferences['battery_importance'] / 5)
+    score += user_weights['portability'] * portability_factor * (preferences['portability_importance'] / 5)
+    
+    # Donanım puanları ve marka güvenilirlik
+    score += weights['specs']['ram'] * (df['ram_gb'] / 16).clip(upper=1.0)
+    score += weights['specs']['ssd'] * (df['ssd_gb'] / 1024).clip(upper=1.0)
+    score += weights['brand_reliability'] * df['brand_score']
+    
+    return score.clip(0, 100)
+
+def compute_budget_curve(df, preferences, weights):
+    """Her bütçe için alınabilecek en iyi laptop eğrisi (fiyat sıralı önek maksimumları)
+    
+    Eğrideki her satır bir fiyat noktasıdır: o fiyata kadar ulaşılabilen en iyi
+    puan ve performans ile en iyi puanlı laptop. `score_step` ve
+    `performance_step` sütunları eğrinin yükseldiği basamakları işaretler.
+    Eğri basamak satırlarına (ve çizginin sonu için en pahalı adaya) sıkıştırılır;
+    aradaki fiyatlarda değerler değişmediğinden `lookup_budget` sonucu aynıdır.
+    """
+    sweep_preferences = dict(preferences, min_budget=0, max_budget=float('inf'))
+    candidates = apply_filters(df, sweep_preferences)
+    if candidates.empty:
+        return pd.DataFrame(columns=['price', 'best_score', 'best_performance', 'best_name',
+                                     'best_price', 'score_step', 'performance_step'])
+    
+    candidates = candidates.sort_values('price', kind='stable')
+    prices = candidates['price'].to_numpy(dtype=float)
+    quality = calculate_quality_scores(candidates, preferences, weights).to_numpy(dtype=float)
+    performance = (candidates['gpu_score'] * 0.6 + candidates['cpu_score'] * 0.4).to_numpy(dtype=float)
+    
+    best_score = np.maximum.accumulate(quality)
+    best_performance = np.maximum.accumulate(performance)
+    
+    # Basamaklar: önceki en iyiyi geçen ilk (en ucuz) laptop
+    score_step = quality > np.concatenate(([-np.inf], best_score[:-1]))
+    performance_step = performance > np.concatenate(([-np.inf], best_performance[:-1]))
+    best_idx = np.maximum.accumulate(np.where(score_step, np.arange(len(prices)), 0))
+    
+    keep = score_step | performance_step
+    keep[-1] = True
+    return pd.DataFrame({
+        'price': prices[keep],
+        'best_score': best_score[keep],
+        'best_performance': best_performance[keep],
+        'best_name': candidates['name'].to_numpy()[best_idx[keep]],
+        'best_price': prices[best_idx[keep]],
+        'score_step': score_step[keep],
+        'performance_step': performance_step[keep],
+    })
+
+@st.cache_data(ttl=3600, max_entries=64)
+def get_budget_curve(_df, catalog_version, scoring_version, preference_key, _weights):
+    """Bütçe eğrisini katalog sürümü, puan tablosu sürümü ve tercih anahtarı başına önbellekle
+    
+    Ağırlıklar `scoring_version` ile aynı anlık görüntüden gelmelidir; eski
+    ağırlıklarla başlamış bir rerun eğriyi yalnızca eski sürüm anahtarına yazar.
+    """
+    return compute_budget_curve(_df, dict(preference_key), _weights)
+
+def lookup_budget(curve, budget):
+    """Verilen bütçeyle ulaşılabilen eğri noktasını döndür (yoksa None)"""
+    position = np.searchsorted(curve['price'].to_numpy(), budget, side='right') - 1
+    if position < 0:
+        return None
+    return curve.iloc[position]
+
+@st.cache_data(ttl=3600, max_entries=4)
+def get_rescored_catalog(_df, catalog_version, scoring_version, _tables):
+    """Kataloğu puan tablosu sürümü başına bir kez yeniden puanla"""
+    return rescore_catalog(_df, _tables)
+
+def refresh_scoring():
+    """Puan tablosu dosyasını kontrol et ve etkin tabloların anlık görüntüsünü döndür"""
+    try:
+        tables, changed = refresh_scoring_tables()
+    except Exception as e:
+        tables, changed = active_scoring_tables(), False
+        if tables is None:
+            st.error(f"Puan tabloları yüklenemedi: {e}")
+            return None
+        st.warning(f"Puan tabloları yeniden yüklenemedi, mevcut tablolar kullanılıyor: {e}")
+    
+    if changed:
+        # Eski puanlara bağlı önbellekleri ve indeksleri birlikte düşür
+        for cached_func in (get_rescored_catalog, get_pareto_frontier, get_budget_curve, get_search_index):
+            cached_func.clear()
+    
+    return tables
+
+def apply_current_scoring(df, tables):
+    """Katalog başka bir tablo sürümüyle puanlandıysa türetilmiş sütunları güncelle"""
+    if df.attrs.get('scoring_version') == tables['version']:
+        return df
+    return get_rescored_catalog(df, get_catalog_version(df), tables['version'], tables)
+
 # Ana uygulama
 def main():
     # Başlık
     st.markdown('<h1 class="main-header">💻 Akıllı Laptop Öneri Sistemi</h1>', unsafe_allow_html=True)
     
+    # Puan tablolarını kontrol et
+    tables = refresh_scoring()
+    if tables is None:
+        return
+    
     # Veriyi yükle
     with st.spinner('Veriler yükleniyor...'):
         df = load_and_process_data()
@@ -480,6 +665,9 @@ def main():
         st.error("Veri yüklenemedi!")
         return
     
+    # Puan tabloları değiştiyse yalnızca türetilmiş sütunları yenile
+    df = apply_current_scoring(df, tables)
+    
     # RTX5060 filtreleme bilgisi
     rtx5060_filtered = st.session_state.get('rtx5060_filtered', 0)
     if rtx5060_filtered > 0:
@@ -490,6 +678,19 @@ def main():
     # Sidebar - Kullanıcı tercihleri
     st.sidebar.header("🔧 Tercihlerinizi Belirtin")
     
+    # Serbest arama
+    st.sidebar.subheader("🔎 Serbest Arama")
+    search_query = st.sidebar.text_input("Ne arıyorsunuz?", placeholder="ör. rtx 4060 oled 32gb 16 inç")
+    if search_query.strip():
+        search_index = get_search_index(df, get_catalog_version(df))
+        match_count = len(search_index.search(search_query))
+        st.sidebar.caption(f"{match_count} laptop aramayla eşleşiyor")
+        last_term = search_index.query_terms(search_query)[-1:]
+        if last_term and last_term[0][1]:
+            suggestions = search_index.suggest(last_term[0][0])
+            if suggestions:
+                st.sidebar.caption("Öneriler: " + ", ".join(suggestions))
+    
     # Bütçe
     st.sidebar.subheader("💰 Bütçe")
     min_budget = st.sidebar.number_input("Minimum Bütçe (TL)", min_value=1000, max_value=200000, value=20000, step=1000)
@@ -499,7 +700,7 @@ def main():
     st.sidebar.subheader("🎯 Kullanım Amacı")
     purpose = st.sidebar.selectbox(
         "Ne için kullanacaksınız?",
-        ['oyun', 'taşınabilirlik', 'üretkenlik', 'tasarım'],
+        Config.PURPOSES,
         format_func=lambda x: {
             'oyun': '🎮 Oyun (Yüksek performans)',
             'taşınabilirlik': '🎒 Taşınabilirlik (Hafif, uzun pil)',
@@ -526,7 +727,7 @@ def main():
             ['Farketmez', 'Windows', 'macOS']
         )
         
-        brands = ['Farketmez'] + [brand.title() for brand in Config.BRAND_SCORES.keys()]
+        brands = ['Farketmez'] + [brand.title() for brand in tables['brand_scores'].keys()]
         brand_preference = st.selectbox("Marka Tercihi", brands)
         
         min_ram = st.selectbox("Minimum RAM (GB)", [4, 8, 16, 32], index=1)
@@ -534,6 +735,7 @@ def main():
     
     # Tercihleri topla
     preferences = {
+        'search_query': search_query,
         'min_budget': min_budget,
         'max_budget': max_budget,
         'ideal_price': (min_budget + max_budget) / 2,
@@ -549,14 +751,16 @@ def main():
     }
     
     # Ana sekmeler
-    tab1, tab2, tab3 = st.tabs(["🏆 Öneriler", "🎯 Fırsatlar", "📊 İstatistikler"])
+    tab1, tab2, tab_pareto, tab_budget, tab3 = st.tabs(
+        ["🏆 Öneriler", "🎯 Fırsatlar", "⚖️ Pareto Cephesi", "📈 Bütçe Eğrisi", "📊 İstatistikler"]
+    )
     
     with tab1:
         st.header("🏆 Size Özel Laptop Önerileri")
         
         if st.button("✨ Önerileri Getir", type="primary"):
             with st.spinner('En iyi laptoplar aranıyor...'):
-                recommendations = get_recommendations(df, preferences)
+                recommendations = get_recommendations(df, preferences, tables['weights'])
             
             if recommendations.empty:
                 st.warning("Kriterlere uygun laptop bulunamadı. Filtrelerinizi gevşetmeyi deneyin.")
@@ -701,7 +905,96 @@ def main():
                         
                         st.markdown("---")
     
+    with tab_pareto:
+        st.header("⚖️ Daha Ucuza Daha İyisi Olmayan Laptoplar")
+        st.caption("Fiyat, performans, RAM, SSD ve taşınabilirlikte aynı anda hiçbir laptopun geçemediği ürünler")
+        
+        pareto = get_pareto_frontier(df, get_catalog_version(df), get_filter_key(preferences))
+        
+        if pareto.empty:
+            st.warning("Kriterlere uygun laptop bulunamadı. Filtrelerinizi gevşetmeyi deneyin.")
+        else:
+            st.success(f"✅ {len(pareto)} laptop Pareto cephesinde!")
+            st.dataframe(
+                pareto[['name', 'price', 'gpu_clean', 'cpu_clean', 'ram_gb', 'ssd_gb', 'screen_size', 'performance_score']],
+                column_config={
+                    'name': 'Laptop',
+                    'price': st.column_config.NumberColumn('Fiyat (TL)', format='%.0f'),
+                    'gpu_clean': 'GPU',
+                    'cpu_clean': 'CPU',
+                    'ram_gb': 'RAM (GB)',
+                    'ssd_gb': 'SSD (GB)',
+                    'screen_size': 'Ekran',
+                    'performance_score': st.column_config.NumberColumn('Performans', format='%.1f'),
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+    
+    with tab_budget:
+        # Grafik kütüphanesi ilk grafik çiziminde yüklenir
+        import plotly.graph_objects as go
+        
+        st.header("📈 Bütçe Artırırsam Ne Kazanırım?")
+        st.caption("Seçtiğiniz kullanım amacı ve filtrelerle her bütçede alınabilecek en iyi laptop")
+        st.caption("ℹ️ Kalite puanı fiyat/bütçe uyumunu içermez; bu nedenle Öneriler sekmesindeki "
+                   "puanla doğrudan karşılaştırılamaz.")
+        
+        curve = get_budget_curve(df, get_catalog_version(df), tables['version'],
+                                 get_preference_key(preferences), tables['weights'])
+        
+        if curve.empty:
+            st.warning("Kriterlere uygun laptop bulunamadı. Filtrelerinizi gevşetmeyi deneyin.")
+        else:
+            extra_budget = st.number_input("Ek Bütçe (TL)", min_value=1000, max_value=100000, value=5000, step=1000)
+            current = lookup_budget(curve, max_budget)
+            upgraded = lookup_budget(curve, max_budget + extra_budget)
+            
+            col1, col2, col3 = st.columns(3)
+            if current is None:
+                with col1:
+                    st.metric("💰 Mevcut Bütçe", f"{max_budget:,.0f} TL", "Uygun laptop yok")
+            else:
+                with col1:
+                    st.metric("💰 Mevcut En İyi Kalite Puanı", f"{current['best_score']:.1f}")
+            if upgraded is not None:
+                score_gain = upgraded['best_score'] - (current['best_score'] if current is not None else 0)
+                perf_gain = upgraded['best_performance'] - (current['best_performance'] if current is not None else 0)
+                with col2:
+                    st.metric(f"⬆️ +{extra_budget:,.0f} TL ile Kalite Puanı", f"{upgraded['best_score']:.1f}", f"{score_gain:+.1f}")
+                with col3:
+                    st.metric("🎮 En İyi Performans", f"{upgraded['best_performance']:.1f}", f"{perf_gain:+.1f}")
+                st.markdown(f"**Önerilen:** {upgraded['best_name']} — {upgraded['best_price']:,.0f} TL")
+            
+            steps = curve[curve['score_step']]
+            fig_curve = go.Figure()
+            fig_curve.add_trace(go.Scatter(x=curve['price'], y=curve['best_score'], mode='lines',
+                                           line_shape='hv', name='En İyi Kalite Puanı'))
+            fig_curve.add_trace(go.Scatter(x=curve['price'], y=curve['best_performance'], mode='lines',
+                                           line_shape='hv', name='En İyi Performans'))
+            fig_curve.add_trace(go.Scatter(x=steps['price'], y=steps['best_score'], mode='markers',
+                                           name='Yükseltme Basamakları', text=steps['best_name']))
+            fig_curve.add_vline(x=max_budget, line_dash='dash', line_color='gray')
+            fig_curve.update_layout(title='Bütçeye Göre En İyi Laptop',
+                                    xaxis_title='Bütçe (TL)', yaxis_title='Skor')
+            st.plotly_chart(fig_curve, use_container_width=True)
+            
+            st.subheader("🪜 Yükseltme Basamakları")
+            st.dataframe(
+                steps[['best_price', 'best_name', 'best_score', 'best_performance']],
+                column_config={
+                    'best_price': st.column_config.NumberColumn('Fiyat (TL)', format='%.0f'),
+                    'best_name': 'Laptop',
+                    'best_score': st.column_config.NumberColumn('Kalite Puanı', format='%.1f'),
+                    'best_performance': st.column_config.NumberColumn('Performans', format='%.1f'),
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+    
     with tab3:
+        import plotly.express as px
+        
         st.header("📊 Pazar İstatistikleri")
         
         col1, col2 = st.columns(2)